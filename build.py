@@ -5,12 +5,57 @@ Generates self-contained executables for Windows, macOS, and Linux
 """
 
 import argparse
+import atexit
+import hashlib
+import json
 import os
 import shutil
+import signal
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+# Serializes console output from concurrent build workers
+_print_lock = threading.Lock()
+
+# Seconds to wait for a cancelled command to exit before forcing it
+CANCEL_TIMEOUT = 30
+
+# Characters cmd.exe interprets in a command line, making a path unsafe to pass
+CMD_METACHARACTERS = frozenset('&|<>^%!()"')
+
+# Outcomes of build_target()
+BUILD_OK = "ok"
+BUILD_FAILED = "failed"
+BUILD_CANCELLED = "cancelled"
+
+# Set once the MSBuild server shutdown has been registered for exit
+_build_server_shutdown_registered = False
+
+# Lines of command output kept for display when a command fails
+OUTPUT_TAIL_LINES = 200
+
+# Build cache manifest, written to the release directory
+BUILD_CACHE_FILE = ".build-cache.json"
+
+# Solution-level files that affect every project's build
+SHARED_BUILD_INPUTS = ("Directory.Build.props", "Directory.Build.targets", "Directory.Packages.props",
+                       "global.json", "NuGet.config", "nuget.config")
+
+# Environment for dotnet invocations: a persistent MSBuild server reuses
+# evaluation results across the per-target publishes
+DOTNET_ENV = {
+    **os.environ,
+    "MSBUILDUSESERVER": "1",
+    "DOTNET_CLI_TELEMETRY_OPTOUT": "1",
+    "DOTNET_SKIP_FIRST_TIME_EXPERIENCE": "1",
+    "NUGET_XMLDOC_MODE": "skip",
+}
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -21,15 +66,14 @@ class Colors:
     WHITE = '\033[1;37m'
     RESET = '\033[0m'
 
-    @staticmethod
-    def supports_color():
-        """Check if terminal supports colors"""
-        return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+
+# Whether to emit colors, checked once rather than on every log line
+_SUPPORTS_COLOR = (hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()) or os.name != 'nt'
 
 
 def colored(text, color):
     """Print colored text if terminal supports it"""
-    if Colors.supports_color() or os.name != 'nt':
+    if _SUPPORTS_COLOR:
         return f"{color}{text}{Colors.RESET}"
     return text
 
@@ -54,100 +98,362 @@ def print_info(text):
     print(colored(text, Colors.YELLOW))
 
 
-def get_file_size_mb(filepath):
-    """Get file size in MB"""
-    if filepath.exists():
-        size_bytes = filepath.stat().st_size
-        return size_bytes / (1024 * 1024)
-    return 0
+def register_build_server_shutdown():
+    """Stop the MSBuild server at exit so it doesn't linger on CI agents.
 
+    Only the MSBuild server is stopped; compiler servers used by other
+    builds or IDEs are left running. Safe to call more than once.
+    """
+    global _build_server_shutdown_registered
+    if not _build_server_shutdown_registered:
+        _build_server_shutdown_registered = True
+        atexit.register(run_command, ["dotnet", "build-server", "shutdown", "--msbuild"], env=DOTNET_ENV)
+
+
+def get_file_size(filepath):
+    """Get file size in bytes, or None if the file does not exist"""
+    try:
+        return filepath.stat().st_size
+    except OSError:
+        return None
+
+
+def to_mb(size_bytes):
+    """Convert a size in bytes to MB"""
+    return size_bytes / (1024 * 1024)
+
+
+def run_command(cmd, cwd=None, env=None, stop=None):
+    """Run a command (argument list) and return success status.
+
+    Output is streamed rather than buffered; only the last OUTPUT_TAIL_LINES
+    lines are kept, and are returned on failure for error display. If a
+    ``stop`` event is given, the command is interrupted once it is set, and
+    the returned status is None rather than False.
+    """
+    # A separate process group lets CTRL_BREAK_EVENT target just this command
+    creationflags = 0
+    if stop is not None and os.name == 'nt':
+        creationflags = subprocess.CREATE_NEW_PROCESS_GROUP
 
-def run_command(cmd, cwd=None):
-    """Run a shell command and return success status"""
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=cwd,
-            shell=True,
-            check=True,
-            capture_output=True,
-            text=True
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            creationflags=creationflags
         )
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
-        return False, e.stderr
+    except OSError as e:
+        # Without a shell, a missing executable raises instead of failing
+        return False, str(e)
+
+    cancelled = []
+
+    def interrupt_on_stop():
+        while proc.poll() is None:
+            if stop.wait(0.5):
+                cancelled.append(True)
+                interrupt_process(proc)
+                return
 
+    if stop is not None:
+        threading.Thread(target=interrupt_on_stop, daemon=True).start()
 
-def clean_build(output_dir, release_dir, configuration):
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    with proc:
+        for line in proc.stdout:
+            tail.append(line)
+
+    if cancelled:
+        return None, ""
+    if proc.returncode != 0:
+        return False, "".join(tail)
+    return True, ""
+
+
+def interrupt_process(proc):
+    """Cancel a running command as Ctrl+C would, forcing it after a timeout.
+
+    A plain terminate only kills the dotnet CLI client; an interrupt is
+    forwarded to the MSBuild server so the build it is running stops too.
+    """
+    try:
+        proc.send_signal(signal.CTRL_BREAK_EVENT if os.name == 'nt' else signal.SIGINT)
+        proc.wait(CANCEL_TIMEOUT)
+        return
+    except subprocess.TimeoutExpired:
+        pass
+    except OSError:
+        return  # Already exited
+
+    proc.terminate()
+    try:
+        proc.wait(CANCEL_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def fast_rmtree(path):
+    """Remove a directory tree with the platform's native delete command"""
+    if os.name == 'nt':
+        # rd only exists inside cmd.exe, which would reparse the path; skip it
+        # for paths cmd.exe could misread (e.g. "R&D" runs "rd ... R")
+        if any(c in CMD_METACHARACTERS for c in str(path)):
+            cmd = None
+        else:
+            cmd = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+    else:
+        cmd = ["rm", "-rf", "--", str(path)]
+
+    if cmd is not None:
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass  # Native command unavailable, fall back below
+
+    # Fall back to shutil, making read-only entries writable as needed
+    if path.exists():
+        shutil.rmtree(path, onerror=lambda func, p, exc: os.chmod(p, 0o777) or func(p))
+
+
+def remove_temp_tree(path):
+    """Remove a temporary build tree, ignoring cleanup errors"""
+    try:
+        fast_rmtree(path)
+    except OSError:
+        pass  # Ignore cleanup errors
+
+
+def clean_build(output_dir, release_dir, configuration, project_dirs, deep_clean=False, verbosity="minimal"):
     """Clean previous build artifacts"""
     print_info("Cleaning previous builds...")
 
     if output_dir.exists():
         try:
-            shutil.rmtree(output_dir, ignore_errors=True)
-            # Ensure it's really gone
-            if output_dir.exists():
-                shutil.rmtree(output_dir, onerror=lambda func, path, exc: os.chmod(path, 0o777) or func(path))
+            fast_rmtree(output_dir)
             print_success("Removed publish directory")
         except Exception as e:
             print_error(f"Failed to remove publish directory: {e}")
 
     if release_dir.exists() and release_dir != output_dir:
         try:
-            shutil.rmtree(release_dir, ignore_errors=True)
+            fast_rmtree(release_dir)
             print_success("Removed release directory")
         except Exception as e:
             print_error(f"Failed to remove release directory: {e}")
 
-    success, _ = run_command(f"dotnet clean --configuration {configuration}")
-    if success:
+    if deep_clean:
+        register_build_server_shutdown()
+        success, _ = run_command(
+            ["dotnet", "clean", "--nologo", "--verbosity", verbosity, "--configuration", configuration],
+            env=DOTNET_ENV
+        )
+        if success:
+            print_success("Clean complete")
+        else:
+            print_error("Clean failed")
+    else:
+        # Removing bin/obj directly avoids a full MSBuild evaluation pass
+        for project_dir in project_dirs:
+            for artifact_dir in (project_dir / "bin", project_dir / "obj"):
+                if artifact_dir.exists():
+                    try:
+                        fast_rmtree(artifact_dir)
+                    except Exception as e:
+                        print_error(f"Failed to remove {artifact_dir}: {e}")
         print_success("Clean complete")
+
+    print()
+
+
+def restore_packages(project_path, runtimes, verbosity="minimal"):
+    """Restore NuGet packages once for every target runtime"""
+    print_info("Restoring packages...")
+    register_build_server_shutdown()
+
+    # A single restore covering all RIDs lets each publish skip its own restore
+    cmd = [
+        "dotnet", "restore",
+        str(project_path),
+        "--nologo",
+        "--verbosity", verbosity,
+        f'-p:RuntimeIdentifiers="{";".join(runtimes)}"',
+        "-p:SelfContained=true"
+    ]
+    if (project_path.parent / "packages.lock.json").exists():
+        cmd.append("-p:RestoreLockedMode=true")
+
+    success, output = run_command(cmd, env=DOTNET_ENV)
+    if success:
+        print_success("Restore complete")
     else:
-        print_error("Clean failed")
+        print_error("Restore failed")
+        print(output)
 
     print()
+    return success
+
+
+def get_sdk_version():
+    """Get the installed .NET SDK version, or an empty string if unavailable"""
+    try:
+        result = subprocess.run(["dotnet", "--version"], capture_output=True, text=True, env=DOTNET_ENV)
+        return result.stdout.strip()
+    except OSError:
+        return ""
+
+
+def inputs_hash(script_dir, project_dirs, sdk_version):
+    """Hash the build inputs from file paths, sizes and modification times"""
+    entries = []
+    for name in SHARED_BUILD_INPUTS:
+        path = script_dir / name
+        if path.is_file():
+            stat = path.stat()
+            entries.append((name, stat.st_mtime_ns, stat.st_size))
+
+    for project_dir in project_dirs:
+        for root, dirs, files in os.walk(project_dir):
+            # Build outputs are not inputs
+            dirs[:] = [d for d in dirs if d not in ("bin", "obj")]
+            for file_name in files:
+                path = os.path.join(root, file_name)
+                stat = os.stat(path)
+                entries.append((os.path.relpath(path, script_dir), stat.st_mtime_ns, stat.st_size))
+
+    digest = hashlib.sha256(sdk_version.encode())
+    for rel_path, mtime_ns, size in sorted(entries):
+        digest.update(f"{rel_path}|{mtime_ns}|{size}\n".encode())
+    return digest.hexdigest()
+
+
+def load_build_cache(release_dir):
+    """Load the build cache manifest, returning an empty one if missing or invalid"""
+    try:
+        with open(release_dir / BUILD_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_build_cache(release_dir, cache):
+    """Write the build cache manifest"""
+    try:
+        with open(release_dir / BUILD_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print_error(f"Failed to write build cache: {e}")
+
+
+def is_cached(target, target_hash, cache):
+    """Check whether a target's executable is up to date with its inputs"""
+    entry = cache.get(target.runtime)
+    if not isinstance(entry, dict) or entry.get("hash") != target_hash:
+        return False
+    return get_file_size(target.target_exe) == entry.get("exe_size")
+
 
+@dataclass(frozen=True)
+class Target:
+    """A publish target with its staging and release paths resolved up front"""
+    runtime: str
+    name: str
+    temp_output: Path
+    source_exe: Path
+    target_exe: Path
 
-def build_target(project_path, runtime, name, configuration, output_dir, release_dir):
-    """Build for a specific target platform"""
-    print(colored(f"Building for {name} ({runtime})...", Colors.CYAN))
 
-    # Temporary build directory
+def make_target(runtime, name, output_dir, release_dir):
+    """Create a Target, deriving its executable names from the runtime"""
+    extension = ".exe" if runtime.startswith("win") else ""
+    arch_name = runtime.replace("-", "_")
     temp_output = output_dir / "temp" / runtime
+    return Target(
+        runtime,
+        name,
+        temp_output,
+        temp_output / f"CableConcentricityCalculator.Gui{extension}",
+        release_dir / f"CableConcentricityCalculator_{arch_name}{extension}"
+    )
+
 
-    # Build command
+def publish_command(project_path, target, configuration, compress=False):
+    """Build the publish command for a target, excluding output verbosity"""
     cmd = [
-        "dotnet publish",
-        f'"{project_path}"',
-        f"--configuration {configuration}",
-        f"--runtime {runtime}",
-        "--self-contained true",
-        f'--output "{temp_output}"',
+        "dotnet", "publish",
+        str(project_path),
+        "--nologo",
+        "--configuration", configuration,
+        "--runtime", target.runtime,
+        "--self-contained", "true",
+        "--output", str(target.temp_output),
+        "--no-restore",
         "-p:PublishSingleFile=true",
         "-p:PublishTrimmed=false",
-        "-p:IncludeNativeLibrariesForSelfExtract=true",
-        "-p:EnableCompressionInSingleFile=true"
+        "-p:IncludeNativeLibrariesForSelfExtract=true"
     ]
+    if compress:
+        cmd.append("-p:EnableCompressionInSingleFile=true")
+    return cmd
+
+
+def build_target(project_path, target, configuration, release_dir, compress=False, verbosity="minimal", stop=None,
+                 fail_fast=True):
+    """Build for a specific target platform.
+
+    Returns a (status, exe_size) pair: status is BUILD_OK, BUILD_FAILED or
+    BUILD_CANCELLED, and exe_size is the staged executable's size in bytes
+    when the build succeeded. Setting ``stop`` cancels the build; with
+    ``fail_fast``, a failure sets it so sibling builds are cancelled.
+    """
+    with _print_lock:
+        print(colored(f"Building for {target.name} ({target.runtime})...", Colors.CYAN))
+
+    cmd = publish_command(project_path, target, configuration, compress) + ["--verbosity", verbosity]
+    success, output = run_command(cmd, env=DOTNET_ENV, stop=stop)
+
+    if success is None:
+        with _print_lock:
+            print_info(f"{target.name} build cancelled")
+            print()
+        return BUILD_CANCELLED, None
+
+    # Report each target as one uninterrupted block
+    with _print_lock:
+        exe_size = _finalize_target(success, output, project_path, target, release_dir)
+        print()
 
-    success, output = run_command(" ".join(cmd))
+    if exe_size is None:
+        if fail_fast and stop is not None:
+            stop.set()
+        return BUILD_FAILED, None
+    return BUILD_OK, exe_size
 
-    if success:
-        print_success(f"{name} build successful")
 
-        # Get source and target executable names
-        source_exe_name = "CableConcentricityCalculator.Gui.exe" if runtime.startswith("win") else "CableConcentricityCalculator.Gui"
-        source_exe_path = temp_output / source_exe_name
+def _finalize_target(success, output, project_path, target, release_dir):
+    """Stage the published executable into the release directory and report.
 
-        # Architecture-specific naming
-        arch_name = runtime.replace("-", "_")
-        extension = ".exe" if runtime.startswith("win") else ""
-        target_exe_name = f"CableConcentricityCalculator_{arch_name}{extension}"
-        target_exe_path = release_dir / target_exe_name
+    Returns the staged executable's size in bytes, or None on failure.
+    """
+    if success:
+        print_success(f"{target.name} build successful")
+
+        source_exe_path = target.source_exe
+        target_exe_path = target.target_exe
 
-        # Copy executable to release directory
+        # Move executable to release directory; the temp tree is deleted after
+        # the build, so a copy is only needed if the rename fails
         if source_exe_path.exists():
             release_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_exe_path, target_exe_path)
+            try:
+                os.replace(source_exe_path, target_exe_path)
+            except OSError:
+                shutil.copy2(source_exe_path, target_exe_path)
 
             # Copy Libraries folder from source project (not build output, as Git LFS files may not be copied)
             source_libraries = project_path.parent.parent / "CableConcentricityCalculator" / "Libraries"
@@ -161,26 +467,33 @@ def build_target(project_path, runtime, name, configuration, output_dir, release
                     except:
                         pass
 
-            size_mb = get_file_size_mb(target_exe_path)
-            print(colored(f"  Size: {size_mb:.2f} MB", Colors.WHITE))
-            print(colored(f"  Output: {target_exe_name}", Colors.WHITE))
+            exe_size = get_file_size(target_exe_path)
+            if exe_size is None:
+                print_error(f"Executable not found: {target_exe_path}")
+                return None
+            print(colored(f"  Size: {to_mb(exe_size):.2f} MB", Colors.WHITE))
+            print(colored(f"  Output: {target_exe_path.name}", Colors.WHITE))
         else:
             print_error(f"Executable not found: {source_exe_path}")
-            return False
+            return None
 
-        return True
+        return exe_size
     else:
-        print_error(f"{name} build failed")
+        print_error(f"{target.name} build failed")
         print(output)
-        return False
+        return None
 
 
 def main():
     """Main build script entry point"""
     parser = argparse.ArgumentParser(description="Build Cable Concentricity Calculator")
     parser.add_argument("--clean", action="store_true", help="Clean before building")
+    parser.add_argument("--deep-clean", action="store_true", help="Clean before building, also running 'dotnet clean'")
     parser.add_argument("--configuration", default="Release", choices=["Debug", "Release"], help="Build configuration")
     parser.add_argument("--target", help="Build specific target only (e.g., win-x64, linux-x64)")
+    parser.add_argument("--compress", action="store_true", help="Compress the single-file executables (smaller, slower to build)")
+    parser.add_argument("--keep-going", action="store_true", help="Keep building other targets after one fails")
+    parser.add_argument("--verbose", action="store_true", help="Show normal-verbosity dotnet output for failed builds")
     parser.add_argument("--skip-tests", action="store_true", help="Skip running tests")
 
     args = parser.parse_args()
@@ -188,9 +501,12 @@ def main():
     # Paths
     script_dir = Path(__file__).parent.absolute()
     gui_project = script_dir / "CableConcentricityCalculator.Gui" / "CableConcentricityCalculator.Gui.csproj"
+    project_dirs = [gui_project.parent, script_dir / "CableConcentricityCalculator"]
     output_dir = script_dir / "Publish"
     release_dir = output_dir / "Release"
 
+    verbosity = "normal" if args.verbose else "minimal"
+
     # Print header
     print_header("Cable Concentricity Calculator Build Script")
     print_info(f"Configuration: {args.configuration}")
@@ -202,8 +518,8 @@ def main():
         sys.exit(1)
 
     # Clean if requested
-    if args.clean:
-        clean_build(output_dir, release_dir, args.configuration)
+    if args.clean or args.deep_clean:
+        clean_build(output_dir, release_dir, args.configuration, project_dirs, args.deep_clean, verbosity)
 
     # Create output directories
     output_dir.mkdir(exist_ok=True)
@@ -211,70 +527,120 @@ def main():
 
     # Define build targets
     all_targets = [
-        {"runtime": "win-x64", "name": "Windows x64"},
-        {"runtime": "osx-x64", "name": "macOS x64 (Intel)"},
-        {"runtime": "osx-arm64", "name": "macOS ARM64 (Apple Silicon)"},
-        {"runtime": "linux-x64", "name": "Linux x64"},
+        make_target("win-x64", "Windows x64", output_dir, release_dir),
+        make_target("osx-x64", "macOS x64 (Intel)", output_dir, release_dir),
+        make_target("osx-arm64", "macOS ARM64 (Apple Silicon)", output_dir, release_dir),
+        make_target("linux-x64", "Linux x64", output_dir, release_dir),
     ]
 
     # Filter targets if specific target requested
     if args.target:
-        targets = [t for t in all_targets if t["runtime"] == args.target]
+        targets = [t for t in all_targets if t.runtime == args.target]
         if not targets:
             print_error(f"Unknown target: {args.target}")
-            print_info("Available targets: " + ", ".join(t["runtime"] for t in all_targets))
+            print_info("Available targets: " + ", ".join(t.runtime for t in all_targets))
             sys.exit(1)
     else:
         targets = all_targets
 
-    # Build each target
-    failed_builds = []
-    built_executables = []
+    # Skip targets whose inputs and publish command are unchanged since their last build
+    source_hash = inputs_hash(script_dir, project_dirs, get_sdk_version())
+    target_hashes = {}
     for target in targets:
-        success = build_target(
-            gui_project,
-            target["runtime"],
-            target["name"],
-            args.configuration,
-            output_dir,
-            release_dir
-        )
-
-        if not success:
-            failed_builds.append(target["name"])
-        else:
-            arch_name = target["runtime"].replace("-", "_")
-            extension = ".exe" if target["runtime"].startswith("win") else ""
-            exe_name = f"CableConcentricityCalculator_{arch_name}{extension}"
-            built_executables.append((target["name"], exe_name))
-
+        cmd = publish_command(gui_project, target, args.configuration, args.compress)
+        key = "\n".join([source_hash] + cmd)
+        target_hashes[target.runtime] = hashlib.sha256(key.encode()).hexdigest()
+
+    cache = load_build_cache(release_dir)
+    cached_targets = [t for t in targets if is_cached(t, target_hashes[t.runtime], cache)]
+    for target in cached_targets:
+        print_success(f"{target.name} is up to date (cached)")
+    if cached_targets:
         print()
+    stale_targets = [t for t in targets if t not in cached_targets]
+
+    if stale_targets and not restore_packages(gui_project, [t.runtime for t in stale_targets], verbosity):
+        sys.exit(1)
 
-    # Clean up temporary build directory
+    # Build all targets concurrently; each publish is an independent process.
+    # Setting stop cancels running builds: on Ctrl+C, and unless --keep-going
+    # is given, on the first failure.
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=max(len(stale_targets), 1)) as executor:
+        futures = [
+            executor.submit(
+                build_target,
+                gui_project,
+                target,
+                args.configuration,
+                release_dir,
+                args.compress,
+                verbosity,
+                stop,
+                not args.keep_going
+            )
+            for target in stale_targets
+        ]
+        try:
+            results = [future.result() for future in futures]
+        except KeyboardInterrupt:
+            # On Windows the publishes run in their own process groups and
+            # don't see Ctrl+C; interrupt them so the executor can shut down
+            stop.set()
+            raise
+
+    # Executable sizes, recorded once per target: from the cache for cached
+    # targets (already verified against the file) or from the build itself
+    exe_sizes = {t.runtime: cache[t.runtime]["exe_size"] for t in cached_targets}
+    failed_builds = []
+    cancelled_builds = []
+    for target, (status, exe_size) in zip(stale_targets, results):
+        if status == BUILD_OK:
+            exe_sizes[target.runtime] = exe_size
+            cache[target.runtime] = {"hash": target_hashes[target.runtime], "exe_size": exe_size}
+        else:
+            if status == BUILD_CANCELLED:
+                cancelled_builds.append(target.name)
+            else:
+                failed_builds.append(target.name)
+            cache.pop(target.runtime, None)
+    save_build_cache(release_dir, cache)
+
+    # Clean up temporary build directory: move it aside, then delete it in a
+    # non-daemon thread so the summary isn't held up (the interpreter waits
+    # for the thread before exiting)
     temp_dir = output_dir / "temp"
     if temp_dir.exists():
         try:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass  # Ignore cleanup errors
+            staging = temp_dir.with_name(f"temp.delete.{os.getpid()}")
+            os.replace(temp_dir, staging)
+        except OSError:
+            # Rename fails while something holds a handle in the tree (common
+            # on Windows); delete in place so everything removable is removed
+            remove_temp_tree(temp_dir)
+        else:
+            threading.Thread(target=remove_temp_tree, args=(staging,)).start()
 
     # Print summary
-    if failed_builds:
+    if failed_builds or cancelled_builds:
         print_error("Build Failed")
-        print_info("Failed targets:")
-        for name in failed_builds:
-            print(f"  - {name}")
+        if failed_builds:
+            print_info("Failed targets:")
+            for name in failed_builds:
+                print(f"  - {name}")
+        if cancelled_builds:
+            print_info("Cancelled targets:")
+            for name in cancelled_builds:
+                print(f"  - {name}")
         sys.exit(1)
     else:
         print_header("Build Complete")
         print_info(f"Output directory: {release_dir}")
         print()
         print(colored("Built executables:", Colors.CYAN))
-        for name, exe_name in built_executables:
-            exe_path = release_dir / exe_name
-            if exe_path.exists():
-                size_mb = get_file_size_mb(exe_path)
-                print(colored(f"  - {name}: {exe_name} ({size_mb:.2f} MB)", Colors.WHITE))
+        for target in targets:
+            size_mb = to_mb(exe_sizes[target.runtime])
+            print(colored(f"  - {target.name}: {target.target_exe.name} ({size_mb:.2f} MB)", Colors.WHITE))
         print()
         print_success("All builds completed successfully!")
 